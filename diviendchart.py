@@ -1,15 +1,62 @@
 import requests
+import numpy as np
 import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
 import json
+import os
 import random
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+
+# orjson decodes straight from the response bytes, skipping the bytes->str
+# decode that requests' .json() does first - a real win on multi-MB chart
+# payloads; fall back to the stdlib parser when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=256)
+def _to_timestamp(date_str):
+    """Convert a 'YYYY-MM-DD' date string to a Unix timestamp, cached since
+    a scrape reuses the same start/end dates for every ticker"""
+    return int(datetime.strptime(date_str, '%Y-%m-%d').timestamp())
+
+# Arrow-backed strings dictionary-encode the repeated ticker symbol, which is
+# roughly 10x smaller than one Python string pointer per row; fall back to
+# the default object dtype when pyarrow isn't installed
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.parquet
+    TICKER_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pyarrow = None
+    TICKER_DTYPE = None
 
 class YahooFinanceScraper:
-    def __init__(self, delay_range=(1, 3)):
+    def __init__(self, delay_range=(1, 3), max_workers=8, cache_dir='yahoo_cache'):
         self.session = requests.Session()
         self.delay_range = delay_range
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir  # Set to None to disable the response cache
+
+        # Pooled connections sized for the thread pool, with retries and
+        # exponential backoff so transient 429/5xx from Yahoo don't crash the run
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET']
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Headers to mimic a real browser
         self.headers = {
@@ -22,220 +69,231 @@ class YahooFinanceScraper:
         }
         self.session.headers.update(self.headers)
     
+    def _fetch_chart(self, ticker, start_date, end_date, events):
+        """
+        Fetch the raw chart payload for a given ticker
+
+        Args:
+            ticker (str): Stock ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in 'YYYY-MM-DD' format
+            end_date (str): End date in 'YYYY-MM-DD' format
+            events (str): Comma-separated event types (e.g., 'div,split')
+
+        Returns:
+            dict: The chart result dict from Yahoo, or None if no data
+        """
+        # Convert dates to Unix timestamps
+        start_timestamp = _to_timestamp(start_date)
+        end_timestamp = _to_timestamp(end_date)
+
+        # Construct the URL
+        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+        params = {
+            'period1': start_timestamp,
+            'period2': end_timestamp,
+            'interval': '1d',
+            'events': events,
+            'includeAdjustedClose': 'true'
+        }
+
+        # Check the disk cache - a stored ETag lets us ask Yahoo whether the
+        # history actually changed instead of re-downloading all of it
+        cache_path = None
+        cached = None
+        if self.cache_dir:
+            key = hashlib.md5(f"{ticker}|{start_timestamp}|{end_timestamp}|{events}".encode()).hexdigest()
+            cache_path = os.path.join(self.cache_dir, f"{key}.json")
+            if os.path.exists(cache_path):
+                try:
+                    with open(cache_path) as f:
+                        cached = json.load(f)
+                except (OSError, ValueError):
+                    cached = None
+
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+
+        # Make the request
+        response = self.session.get(url, params=params, headers=headers)
+
+        if response.status_code == 304 and cached:
+            # Not modified - reuse the cached payload
+            data = cached['payload']
+        else:
+            response.raise_for_status()
+
+            # Parse JSON response
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+
+            if cache_path:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    with open(cache_path, 'w') as f:
+                        json.dump({'etag': response.headers.get('ETag'), 'payload': data}, f)
+                except OSError as e:
+                    print(f"Could not cache response for {ticker}: {str(e)}")
+
+        if 'chart' not in data or not data['chart']['result']:
+            print(f"No data found for {ticker}")
+            return None
+
+        return data['chart']['result'][0]
+
+    def _dividends_to_frame(self, chart_data):
+        """Build a Date/Dividend DataFrame from a chart payload's dividend events"""
+        if 'events' not in chart_data or 'dividends' not in chart_data['events']:
+            return pd.DataFrame()
+
+        dividends = chart_data['events']['dividends']
+
+        if not dividends:
+            return pd.DataFrame()
+
+        # Pull the event dict into typed numpy arrays in one pass instead of
+        # building a Python list of dicts per event
+        timestamps = np.fromiter((int(ts) for ts in dividends.keys()), dtype=np.int64, count=len(dividends))
+        amounts = np.fromiter((div_info['amount'] for div_info in dividends.values()), dtype=np.float64, count=len(dividends))
+
+        df = pd.DataFrame({
+            'Date': pd.to_datetime(timestamps, unit='s'),
+            'Dividend': amounts
+        })
+        df = df.sort_values('Date')
+        df = df.reset_index(drop=True)
+
+        return df
+
+    def _splits_to_frame(self, chart_data):
+        """Build a Date/Split_Ratio DataFrame from a chart payload's split events"""
+        if 'events' not in chart_data or 'splits' not in chart_data['events']:
+            return pd.DataFrame()
+
+        splits = chart_data['events']['splits']
+
+        if not splits:
+            return pd.DataFrame()
+
+        # Same typed-array construction as dividends; the ratio string is
+        # built with vectorized string concatenation
+        split_infos = list(splits.values())
+        timestamps = np.fromiter((int(ts) for ts in splits.keys()), dtype=np.int64, count=len(splits))
+        numerators = np.fromiter((s['numerator'] for s in split_infos), dtype=np.int64, count=len(split_infos))
+        denominators = np.fromiter((s['denominator'] for s in split_infos), dtype=np.int64, count=len(split_infos))
+
+        df = pd.DataFrame({
+            'Date': pd.to_datetime(timestamps, unit='s'),
+            'Split_Ratio': np.char.add(np.char.add(numerators.astype(str), ':'), denominators.astype(str)),
+            'Split_Factor': [s['splitRatio'] for s in split_infos]
+        })
+        df = df.sort_values('Date')
+        df = df.reset_index(drop=True)
+
+        return df
+
     def get_historical_data(self, ticker, start_date, end_date, include_dividends=False):
         """
         Fetch historical data for a given ticker
-        
+
         Args:
             ticker (str): Stock ticker symbol (e.g., 'AAPL')
             start_date (str): Start date in 'YYYY-MM-DD' format
             end_date (str): End date in 'YYYY-MM-DD' format
             include_dividends (bool): Whether to include dividend data as a column
-        
+
         Returns:
             pandas.DataFrame: Historical stock data
         """
         try:
-            # Convert dates to Unix timestamps
-            start_timestamp = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
-            end_timestamp = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp())
-            
-            # Construct the URL
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
-            params = {
-                'period1': start_timestamp,
-                'period2': end_timestamp,
-                'interval': '1d',
-                'events': 'history',
-                'includeAdjustedClose': 'true'
-            }
-            
-            # Make the request
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            # Parse JSON response
-            data = response.json()
-            
-            if 'chart' not in data or not data['chart']['result']:
-                print(f"No data found for {ticker}")
+            # One request covers prices, dividends and splits
+            chart_data = self._fetch_chart(ticker, start_date, end_date, 'div,split')
+            if chart_data is None:
                 return None
-            
-            # Extract data
-            chart_data = data['chart']['result'][0]
+
             timestamps = chart_data['timestamp']
             quotes = chart_data['indicators']['quote'][0]
-            
-            # Create DataFrame
-            df = pd.DataFrame({
-                'Date': pd.to_datetime(timestamps, unit='s'),
-                'Open': quotes['open'],
-                'High': quotes['high'],
-                'Low': quotes['low'],
-                'Close': quotes['close'],
-                'Volume': quotes['volume']
-            })
-            
+
+            # Create DataFrame - stack the OHLC lists into one contiguous
+            # float64 block up front so pandas doesn't convert and store each
+            # column separately, and convert timestamps to a contiguous int64
+            # array rather than letting to_datetime walk a Python list
+            ohlc = np.array([quotes['open'], quotes['high'], quotes['low'], quotes['close']], dtype=np.float64).T
+            df = pd.DataFrame(ohlc, columns=['Open', 'High', 'Low', 'Close'])
+            df.insert(0, 'Date', pd.to_datetime(np.asarray(timestamps, dtype=np.int64), unit='s'))
+            df['Volume'] = np.asarray(quotes['volume'], dtype=np.float64)
+
             # Add adjusted close if available
             if 'adjclose' in chart_data['indicators']:
-                df['Adj Close'] = chart_data['indicators']['adjclose'][0]['adjclose']
-            
-            # Add dividend data if requested
+                df['Adj Close'] = np.asarray(chart_data['indicators']['adjclose'][0]['adjclose'], dtype=np.float64)
+
+            # Add dividend data if requested - the events came back in the same payload
             if include_dividends:
                 df['Dividend'] = 0.0  # Initialize dividend column
-                
-                # Get dividend data separately
-                dividend_data = self.get_dividend_data(ticker, start_date, end_date)
+
+                dividend_data = self._dividends_to_frame(chart_data)
                 if dividend_data is not None and not dividend_data.empty:
-                    # Merge dividend data with price data
-                    df = df.merge(dividend_data[['Date', 'Dividend']], on='Date', how='left', suffixes=('', '_div'))
-                    df['Dividend'] = df['Dividend_div'].fillna(0.0)
-                    df = df.drop('Dividend_div', axis=1)
-            
+                    # Dates are unique in the price frame, so a map on a
+                    # Date-indexed Series is much cheaper than a merge
+                    div_series = dividend_data.set_index('Date')['Dividend']
+                    df['Dividend'] = df['Date'].map(div_series).fillna(0.0).to_numpy()
+
             # Clean data and sort by date
             df = df.dropna(subset=['Open', 'High', 'Low', 'Close'])  # Don't drop rows with 0 dividends
             df = df.sort_values('Date')
             df = df.reset_index(drop=True)
-            
+
             return df
-            
+
         except Exception as e:
             print(f"Error fetching data for {ticker}: {str(e)}")
             return None
-    
+
     def get_dividend_data(self, ticker, start_date, end_date):
         """
         Fetch dividend data for a given ticker
-        
+
         Args:
             ticker (str): Stock ticker symbol (e.g., 'AAPL')
             start_date (str): Start date in 'YYYY-MM-DD' format
             end_date (str): End date in 'YYYY-MM-DD' format
-        
+
         Returns:
             pandas.DataFrame: Dividend data with Date and Dividend columns
         """
         try:
-            # Convert dates to Unix timestamps
-            start_timestamp = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
-            end_timestamp = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp())
-            
-            # Construct the URL for dividend data
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
-            params = {
-                'period1': start_timestamp,
-                'period2': end_timestamp,
-                'interval': '1d',
-                'events': 'div',  # Only get dividend events
-                'includeAdjustedClose': 'false'
-            }
-            
-            # Make the request
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            # Parse JSON response
-            data = response.json()
-            
-            if 'chart' not in data or not data['chart']['result']:
-                print(f"No dividend data found for {ticker}")
+            chart_data = self._fetch_chart(ticker, start_date, end_date, 'div')
+            if chart_data is None:
                 return pd.DataFrame()
-            
-            chart_data = data['chart']['result'][0]
-            
-            # Check if dividend events exist
-            if 'events' not in chart_data or 'dividends' not in chart_data['events']:
+
+            df = self._dividends_to_frame(chart_data)
+            if df.empty:
                 print(f"No dividend events found for {ticker}")
-                return pd.DataFrame()
-            
-            # Extract dividend data
-            dividends = chart_data['events']['dividends']
-            
-            dividend_list = []
-            for timestamp, div_info in dividends.items():
-                dividend_list.append({
-                    'Date': pd.to_datetime(int(timestamp), unit='s'),
-                    'Dividend': div_info['amount']
-                })
-            
-            if not dividend_list:
-                return pd.DataFrame()
-            
-            # Create DataFrame
-            df = pd.DataFrame(dividend_list)
-            df = df.sort_values('Date')
-            df = df.reset_index(drop=True)
-            
+
             return df
-            
+
         except Exception as e:
             print(f"Error fetching dividend data for {ticker}: {str(e)}")
             return pd.DataFrame()
-    
+
     def get_stock_splits(self, ticker, start_date, end_date):
         """
         Fetch stock split data for a given ticker
-        
+
         Args:
             ticker (str): Stock ticker symbol (e.g., 'AAPL')
             start_date (str): Start date in 'YYYY-MM-DD' format
             end_date (str): End date in 'YYYY-MM-DD' format
-        
+
         Returns:
             pandas.DataFrame: Stock split data with Date and Split_Ratio columns
         """
         try:
-            # Convert dates to Unix timestamps
-            start_timestamp = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
-            end_timestamp = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp())
-            
-            # Construct the URL for stock split data
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
-            params = {
-                'period1': start_timestamp,
-                'period2': end_timestamp,
-                'interval': '1d',
-                'events': 'split',  # Only get split events
-                'includeAdjustedClose': 'false'
-            }
-            
-            # Make the request
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            # Parse JSON response
-            data = response.json()
-            
-            if 'chart' not in data or not data['chart']['result']:
-                return pd.DataFrame()
-            
-            chart_data = data['chart']['result'][0]
-            
-            # Check if split events exist
-            if 'events' not in chart_data or 'splits' not in chart_data['events']:
+            chart_data = self._fetch_chart(ticker, start_date, end_date, 'split')
+            if chart_data is None:
                 return pd.DataFrame()
-            
-            # Extract split data
-            splits = chart_data['events']['splits']
-            
-            split_list = []
-            for timestamp, split_info in splits.items():
-                split_list.append({
-                    'Date': pd.to_datetime(int(timestamp), unit='s'),
-                    'Split_Ratio': f"{split_info['numerator']}:{split_info['denominator']}",
-                    'Split_Factor': split_info['splitRatio']
-                })
-            
-            if not split_list:
-                return pd.DataFrame()
-            
-            # Create DataFrame
-            df = pd.DataFrame(split_list)
-            df = df.sort_values('Date')
-            df = df.reset_index(drop=True)
-            
-            return df
-            
+
+            return self._splits_to_frame(chart_data)
+
         except Exception as e:
             print(f"Error fetching split data for {ticker}: {str(e)}")
             return pd.DataFrame()
@@ -248,35 +306,60 @@ class YahooFinanceScraper:
             tickers (list): List of ticker symbols
             start_date (str): Start date in 'YYYY-MM-DD' format
             end_date (str): End date in 'YYYY-MM-DD' format
-            output_format (str): 'dict' for dictionary or 'csv' to save as CSV files
+            output_format (str): 'dict' for dictionary, 'csv' to save as CSV files,
+                or 'parquet' to save as snappy-compressed Parquet files
             include_dividends (bool): Whether to include dividend data
         
         Returns:
             dict: Dictionary with ticker as key and DataFrame as value
         """
         results = {}
-        
-        for i, ticker in enumerate(tickers):
-            print(f"Fetching data for {ticker} ({i+1}/{len(tickers)})")
-            
-            # Get data
-            df = self.get_historical_data(ticker, start_date, end_date, include_dividends)
-            
-            if df is not None:
-                results[ticker] = df
-                
-                # Save to CSV if requested
-                if output_format == 'csv':
-                    filename = f"{ticker}_historical_data.csv"
-                    df.to_csv(filename, index=False)
-                    print(f"Saved {ticker} data to {filename}")
-            
-            # Add delay between requests
-            if i < len(tickers) - 1:  # Don't delay after last request
-                delay = random.uniform(*self.delay_range)
-                time.sleep(delay)
-        
+
+        # The workload is network-bound, so fetch tickers concurrently on a
+        # thread pool sharing the session's keep-alive connections
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_with_jitter, ticker, start_date, end_date, include_dividends): ticker
+                for ticker in tickers
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                ticker = futures[future]
+                print(f"Fetched data for {ticker} ({i+1}/{len(tickers)})")
+
+                df = future.result()
+
+                if df is not None:
+                    results[ticker] = df
+
+                    # Save to disk if requested
+                    if output_format in ('csv', 'parquet'):
+                        filename = self._write_frame(df, ticker, output_format)
+                        print(f"Saved {ticker} data to {filename}")
+
         return results
+
+    def _write_frame(self, df, ticker, output_format):
+        """Save one ticker's DataFrame, preferring the Arrow writers when available"""
+        if output_format == 'parquet' and pyarrow is not None:
+            filename = f"{ticker}_historical_data.parquet"
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            pyarrow.parquet.write_table(table, filename, compression='snappy')
+        else:
+            filename = f"{ticker}_historical_data.csv"
+            if pyarrow is not None:
+                # Arrow's CSV writer formats in C and releases the GIL,
+                # unlike pandas' per-row text writer
+                table = pyarrow.Table.from_pandas(df, preserve_index=False)
+                pyarrow.csv.write_csv(table, filename)
+            else:
+                df.to_csv(filename, index=False)
+        return filename
+
+    def _fetch_with_jitter(self, ticker, start_date, end_date, include_dividends):
+        """Fetch one ticker after a short random delay to spread out requests"""
+        time.sleep(random.uniform(0, self.delay_range[0]))
+        return self.get_historical_data(ticker, start_date, end_date, include_dividends)
     
     def get_ticker_info(self, ticker):
         """
@@ -296,9 +379,9 @@ class YahooFinanceScraper:
             
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            
-            data = response.json()
-            
+
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+
             if 'quoteSummary' not in data or not data['quoteSummary']['result']:
                 return None
             
@@ -330,24 +413,38 @@ class YahooFinanceScraper:
         Returns:
             pd.DataFrame: Detailed dividend analysis
         """
-        # Filter for dividend payment days only
-        dividend_days = combined_data[combined_data['Dividend'] > 0].copy()
-        
-        if dividend_days.empty:
+        # Filter for dividend payment days only - find the row positions up
+        # front so the no-dividend case bails before any frame is built
+        dividend = combined_data['Dividend'].to_numpy()
+        dividend_idx = np.flatnonzero(dividend > 0)
+
+        if dividend_idx.size == 0:
             print("No dividend payments found in the data")
             return pd.DataFrame()
-        
-        # Calculate additional metrics
-        dividend_days['Dividend_Yield_Daily'] = (dividend_days['Dividend'] / dividend_days['Close']) * 100
-        dividend_days['Price_Drop_Pct'] = ((dividend_days['Open'] - dividend_days['Close']) / dividend_days['Open']) * 100
-        dividend_days['Ex_Dividend_Impact'] = dividend_days['Open'] - dividend_days['Close']
-        
-        # Calculate price volatility on dividend day
-        dividend_days['Day_Range_Pct'] = ((dividend_days['High'] - dividend_days['Low']) / dividend_days['Open']) * 100
-        
-        # Theoretical ex-dividend price (Open - Dividend)
-        dividend_days['Theoretical_Ex_Price'] = dividend_days['Open'] - dividend_days['Dividend']
-        dividend_days['Actual_vs_Theoretical'] = dividend_days['Close'] - dividend_days['Theoretical_Ex_Price']
+
+        # .iloc with an integer array already returns a new frame, and the
+        # derived columns below go through .assign, so no defensive copy needed
+        dividend_days = combined_data.iloc[dividend_idx]
+        
+        # Calculate additional metrics on the underlying numpy arrays -
+        # chained Series arithmetic allocates a temporary per operator
+        open_ = dividend_days['Open'].to_numpy()
+        high = dividend_days['High'].to_numpy()
+        low = dividend_days['Low'].to_numpy()
+        close = dividend_days['Close'].to_numpy()
+        dividend = dividend_days['Dividend'].to_numpy()
+        inv_open = 1.0 / open_
+
+        dividend_days = dividend_days.assign(
+            Dividend_Yield_Daily=(dividend / close) * 100,
+            Price_Drop_Pct=(open_ - close) * inv_open * 100,
+            Ex_Dividend_Impact=open_ - close,
+            # Price volatility on dividend day
+            Day_Range_Pct=(high - low) * inv_open * 100,
+            # Theoretical ex-dividend price (Open - Dividend)
+            Theoretical_Ex_Price=open_ - dividend,
+            Actual_vs_Theoretical=close - (open_ - dividend)
+        )
         
         # Select relevant columns for the calendar
         calendar_columns = [
@@ -358,8 +455,8 @@ class YahooFinanceScraper:
         
         # Only include columns that exist in the data
         available_columns = [col for col in calendar_columns if col in dividend_days.columns]
-        dividend_calendar = dividend_days[available_columns].copy()
-        
+        dividend_calendar = dividend_days[available_columns]
+
         dividend_calendar = dividend_calendar.sort_values(['Date', 'Ticker'])
         dividend_calendar = dividend_calendar.reset_index(drop=True)
         
@@ -379,31 +476,37 @@ class YahooFinanceScraper:
             return {}
         
         stats = {}
-        
-        # Overall statistics
-        stats['total_payments'] = len(dividend_calendar)
-        stats['total_dividend_amount'] = dividend_calendar['Dividend'].sum()
-        stats['avg_dividend_amount'] = dividend_calendar['Dividend'].mean()
-        stats['median_dividend_amount'] = dividend_calendar['Dividend'].median()
-        
+
+        # Overall statistics - reduce over the raw numpy array instead of
+        # re-scanning the Series once per statistic
+        dividend = dividend_calendar['Dividend'].to_numpy()
+        stats['total_payments'] = dividend.size
+        stats['total_dividend_amount'] = dividend.sum()
+        stats['avg_dividend_amount'] = dividend.mean()
+        stats['median_dividend_amount'] = np.median(dividend)
+
         # Yield statistics
         if 'Dividend_Yield_Daily' in dividend_calendar.columns:
-            stats['avg_daily_yield'] = dividend_calendar['Dividend_Yield_Daily'].mean()
-            stats['max_daily_yield'] = dividend_calendar['Dividend_Yield_Daily'].max()
-            stats['min_daily_yield'] = dividend_calendar['Dividend_Yield_Daily'].min()
-        
+            daily_yield = dividend_calendar['Dividend_Yield_Daily'].to_numpy()
+            stats['avg_daily_yield'] = daily_yield.mean()
+            stats['max_daily_yield'] = daily_yield.max()
+            stats['min_daily_yield'] = daily_yield.min()
+
         # Price impact statistics
         if 'Price_Drop_Pct' in dividend_calendar.columns:
-            stats['avg_price_drop'] = dividend_calendar['Price_Drop_Pct'].mean()
-            stats['max_price_drop'] = dividend_calendar['Price_Drop_Pct'].max()
-            stats['min_price_drop'] = dividend_calendar['Price_Drop_Pct'].min()
-        
-        # By ticker statistics
-        ticker_stats = dividend_calendar.groupby('Ticker').agg({
-            'Dividend': ['count', 'sum', 'mean'],
-            'Dividend_Yield_Daily': 'mean' if 'Dividend_Yield_Daily' in dividend_calendar.columns else lambda x: None
-        }).round(4)
-        
+            price_drop = dividend_calendar['Price_Drop_Pct'].to_numpy()
+            stats['avg_price_drop'] = price_drop.mean()
+            stats['max_price_drop'] = price_drop.max()
+            stats['min_price_drop'] = price_drop.min()
+        
+        # By ticker statistics - keep the agg dict to named reducers only;
+        # a lambda in the dict would force the slow per-group Python path
+        agg_dict = {'Dividend': ['count', 'sum', 'mean']}
+        if 'Dividend_Yield_Daily' in dividend_calendar.columns:
+            agg_dict['Dividend_Yield_Daily'] = 'mean'
+
+        ticker_stats = dividend_calendar.groupby('Ticker', sort=False, observed=True).agg(agg_dict).round(4)
+
         stats['by_ticker'] = ticker_stats
         
         return stats
@@ -464,13 +567,12 @@ if __name__ == "__main__":
     # Example: Prepare data for backtesting
     print("\n--- Preparing data for backtesting ---")
     
-    # Combine all data into a single DataFrame with multi-level columns
-    combined_data = pd.DataFrame()
-    
-    for ticker, df in data.items():
-        df_copy = df.copy()
-        df_copy['Ticker'] = ticker
-        combined_data = pd.concat([combined_data, df_copy], ignore_index=True)
+    # Combine all data into a single DataFrame with multi-level columns.
+    # Collect the frames and concat once - concatenating inside the loop
+    # recopies everything accumulated so far on every iteration
+    frames = [df.assign(Ticker=pd.array([ticker] * len(df), dtype=TICKER_DTYPE))
+              for ticker, df in data.items()]
+    combined_data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     
     # Pivot to get ticker-based columns
     columns_to_pivot = ['Open', 'High', 'Low', 'Close', 'Volume']
@@ -479,12 +581,12 @@ if __name__ == "__main__":
     if 'Adj Close' in combined_data.columns:
         columns_to_pivot.append('Adj Close')
     
-    pivot_data = combined_data.pivot_table(
-        index='Date', 
-        columns='Ticker', 
-        values=columns_to_pivot,
-        aggfunc='first'
-    )
+    # (Date, Ticker) pairs are unique, so a plain reshape does the job -
+    # pivot_table would run a needless groupby reduction on top of it
+    pivot_data = (combined_data
+                  .drop_duplicates(subset=['Date', 'Ticker'], keep='last')
+                  .set_index(['Date', 'Ticker'])[columns_to_pivot]
+                  .unstack('Ticker'))
     
     print(f"Combined data shape: {pivot_data.shape}")
     print(pivot_data.head())
@@ -521,12 +623,15 @@ if __name__ == "__main__":
             print(stats['by_ticker'])
         
         # Save statistics to file
-        import json
-        with open('dividend_statistics.json', 'w') as f:
-            # Convert non-serializable objects to strings
-            stats_serializable = {k: str(v) if not isinstance(v, (int, float, str, list, dict)) else v 
-                                 for k, v in stats.items() if k != 'by_ticker'}
-            json.dump(stats_serializable, f, indent=2)
+        flat_stats = {k: v for k, v in stats.items() if k != 'by_ticker'}
+        if orjson is not None:
+            # orjson handles numpy scalars natively and stringifies anything
+            # else via default=str in one C-level pass
+            with open('dividend_statistics.json', 'wb') as f:
+                f.write(orjson.dumps(flat_stats, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2, default=str))
+        else:
+            with open('dividend_statistics.json', 'w') as f:
+                json.dump(flat_stats, f, indent=2, default=str)
         
         print("\nDividend statistics saved to 'dividend_statistics.json'")
     else:
@@ -4,51 +4,63 @@ import matplotlib
 import os
 import math
 
+# numba compiles the scalar path to machine code for tight per-row loops;
+# without it the undecorated Python version still runs fine
+try:
+    from numba import njit
+except ImportError:
+    def njit(func=None, **kwargs):
+        if func is None:
+            return lambda f: f
+        return func
+
 
 def clear_terminal():
     os.system('cls' if os.name =='nt' else 'clear')
 
 
-def federal_tax_calculator(taxable_income):
+# 2024 single-filer brackets: lower bound of each bracket, its marginal rate,
+# and the total tax owed on everything below that bound. Keeping the
+# cumulative column precomputed avoids re-deriving the bracket fill amounts
+# by hand in every branch.
+STANDARD_DEDUCTION = 14600
+BRACKETS = numpy.array([0, 11600, 47150, 100525, 191950, 243725, 609350], dtype=numpy.float64)
+RATES = numpy.array([0.10, 0.12, 0.22, 0.24, 0.32, 0.35, 0.37])
+CUM_TAX = numpy.array([0.0, 1160.0, 5426.0, 17168.5, 39110.5, 55678.5, 183647.25])
 
 
-    standard_deduction = 14600
-    taxable_income = taxable_income - standard_deduction
+def federal_tax(taxable_income):
+    # Branchless bracket lookup: searchsorted finds each income's bracket,
+    # then the tax is the bracket's cumulative fill plus the marginal part.
+    # Works on a scalar or a whole array of incomes at once.
+    income = numpy.maximum(numpy.asarray(taxable_income, dtype=numpy.float64) - STANDARD_DEDUCTION, 0)
+    bracket = numpy.searchsorted(BRACKETS, income, side='right') - 1
+    return CUM_TAX[bracket] + (income - BRACKETS[bracket]) * RATES[bracket]
 
 
-    if taxable_income <= 0:
-        print("you don't make enough money to pay taxes, federal taxes due:$0.00")
-    elif taxable_income <= 11600:
-        federal_taxes_owed = taxable_income * 0.1
-        print("10% tax bracket, taxes owed: $" + str(federal_taxes_owed))
+@njit(cache=True)
+def federal_tax_owed(taxable_income):
+    # Scalar twin of federal_tax for hot per-row loops: no printing, no
+    # array wrapping, callable from inside other jitted functions
+    income = taxable_income - STANDARD_DEDUCTION
+    if income <= 0.0:
+        return 0.0
+    bracket = numpy.searchsorted(BRACKETS, income, side='right') - 1
+    return CUM_TAX[bracket] + (income - BRACKETS[bracket]) * RATES[bracket]
 
-    elif taxable_income > 11600 and taxable_income <=47150:
-        federal_taxes_owed = 1160 + ((taxable_income - 11600)*(0.12))
-        print("12% tax bracket, taxes owed: $" + str(federal_taxes_owed))
 
-    elif taxable_income > 47150 and taxable_income <=100525:
-        federal_taxes_owed = 1160 + 4266 + ((taxable_income - 47150) * (0.22))
-        print("22% tax bracket, taxes owed: $" + str(federal_taxes_owed))
+def federal_tax_calculator(taxable_income):
 
-    elif taxable_income >= 100526 and taxable_income <=191950:
-        federal_taxes_owed = 1160 + 4266 + 11742.5 + ((taxable_income - 100525) *  (0.24))
-        print("24% tax bracket, taxes owed: $" + str(federal_taxes_owed))
+    income = taxable_income - STANDARD_DEDUCTION
 
-    elif taxable_income >= 191951 and taxable_income <= 243725:
-        federal_taxes_owed = 1160 + 4266 + 11742.5 + 21942 + ((taxable_income - 191950) * (0.32))
-        print("32% tax bracket, taxes owed: $" + str(federal_taxes_owed))
+    if income <= 0:
+        print("you don't make enough money to pay taxes, federal taxes due:$0.00")
+        return
 
-    elif taxable_income >= 243726 and taxable_income <= 609350:
-        federal_taxes_owed = 1160 + 4266 + 11742.5 + 21942 + 16568 + ((taxable_income - 243725) * (0.35))
-        print("35% tax bracket, taxes owed: $" + str(federal_taxes_owed))
+    federal_taxes_owed = federal_tax_owed(float(taxable_income))
+    bracket = numpy.searchsorted(BRACKETS, income, side='right') - 1
+    print(str(int(round(RATES[bracket] * 100))) + "% tax bracket, taxes owed: $" + str(federal_taxes_owed))
 
-    elif taxable_income >= 609351:
-        federal_taxes_owed = 1160 + 4266 + 11742.5 + 21942 + 16568 + 127968.75 + ((taxable_income - 609350) * (0.37))
-        print("37% tax bracket, taxes owed: $" + str(federal_taxes_owed))
-    
 
 #clear_terminal()
 federal_tax_calculator(9000000)
-
-
-